@@ -12,7 +12,10 @@ Features:
 """
 
 import itertools
-import random
+import sys
+from functools import lru_cache
+
+import numpy as np
 
 # ---------- Predefined Games ----------
 
@@ -77,45 +80,182 @@ def input_game():
     return players, strategies, payoffs
 
 
+# ---------- Compiled Game Representation ----------
+
+def compile_game(players, strategies, payoffs):
+    """Pack a game into integer-indexed NumPy form, shared by all solvers.
+
+    Returns (player_payoffs, strat_lists, idx_maps): one payoff array of
+    shape (|S_1|, ..., |S_n|) per player, the per-player strategy lists,
+    and the per-player string -> index maps. Compiling once keeps
+    itertools.product and dict hashing off the hot paths entirely.
+    """
+    n = len(players)
+    strat_lists = [strategies[p] for p in players]
+    idx_maps = [{s: k for k, s in enumerate(sl)} for sl in strat_lists]
+    shape = tuple(len(sl) for sl in strat_lists)
+
+    # One dense array per player (structure-of-arrays) instead of one
+    # tuple per profile: every later algorithm is a pure array op.
+    # Narrow the dtype where the inputs allow it: the predefined games are
+    # all small integers, and float32 is plenty for user-entered payoffs.
+    # Halving the element size halves the bytes moved by every reduction.
+    all_vals = [v for vals in payoffs.values() for v in vals]
+    if all(float(v).is_integer() for v in all_vals):
+        dtype = np.int32
+    else:
+        dtype = np.float32
+    player_payoffs = [np.empty(shape, dtype=dtype) for _ in range(n)]
+    for prof, vals in payoffs.items():
+        idx = tuple(idx_maps[i][s] for i, s in enumerate(prof))
+        for k in range(n):
+            player_payoffs[k][idx] = vals[k]
+
+    return player_payoffs, strat_lists, idx_maps
+
+
 # ---------- Solvers ----------
 
-def pure_nash_equilibria(players, strategies, payoffs):
-    equilibria = []
-    for prof in itertools.product(*[strategies[p] for p in players]):
-        current = payoffs[prof]
-        is_eq = True
-        for i, p in enumerate(players):
-            best = current[i]
-            for alt in strategies[p]:
-                if alt == prof[i]:
+def _is_equilibrium_at(player_payoffs, idx, tol):
+    # Check one profile, given as integer indices into the payoff arrays.
+    # One slice per player gathers all of their deviation payoffs at once,
+    # instead of rebuilding an alternative profile tuple per deviation.
+    for i in range(len(idx)):
+        col = player_payoffs[i][idx[:i] + (slice(None),) + idx[i + 1:]]
+        if col.max() > col[idx[i]] + tol:
+            return False
+    return True
+
+
+# Grids at most this many cells get a generated, fully unrolled checker.
+_CODEGEN_MAX_CELLS = 16
+
+@lru_cache(maxsize=None)
+def _compile_ne_checker(shape):
+    # Generate and exec a flat checker specialized to this strategy grid:
+    # every profile and every deviation becomes a literal scalar compare,
+    # with no loop or reduction machinery left. For the common 2x2 games
+    # that is just four cells of three comparisons each.
+    lines = ["def check(pp, tol):", "    eq = []"]
+    for cell in itertools.product(*[range(k) for k in shape]):
+        conds = []
+        for i in range(len(shape)):
+            for alt in range(shape[i]):
+                if alt == cell[i]:
                     continue
-                alt_prof = list(prof)
-                alt_prof[i] = alt
-                alt_prof = tuple(alt_prof)
-                if payoffs[alt_prof][i] > best:
-                    is_eq = False
-                    break
-            if not is_eq:
-                break
-        if is_eq:
-            equilibria.append(prof)
-    return equilibria
+                alt_cell = cell[:i] + (alt,) + cell[i + 1:]
+                conds.append(f"pp[{i}][{cell}] >= pp[{i}][{alt_cell}] - tol")
+        lines.append(f"    if {' and '.join(conds) if conds else 'True'}:")
+        lines.append(f"        eq.append({cell})")
+    lines.append("    return eq")
+
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["check"]
+
+
+def is_nash(players, strategies, payoffs, profile, tol=1e-12, compiled=None):
+    """Check whether a single strategy profile is a pure Nash equilibrium."""
+    if compiled is None:
+        compiled = compile_game(players, strategies, payoffs)
+    player_payoffs, strat_lists, idx_maps = compiled
+
+    idx = tuple(idx_maps[i][s] for i, s in enumerate(profile))
+    return _is_equilibrium_at(player_payoffs, idx, tol)
+
+
+def pure_nash_equilibria(players, strategies, payoffs, tol=1e-12,
+                         first_only=False, compiled=None):
+    if compiled is None:
+        compiled = compile_game(players, strategies, payoffs)
+    player_payoffs, strat_lists, idx_maps = compiled
+    shape = player_payoffs[0].shape
+
+    if first_only:
+        # Scan profiles one at a time and stop at the first equilibrium,
+        # skipping the full-grid reductions below.
+        for idx in itertools.product(*[range(k) for k in shape]):
+            if _is_equilibrium_at(player_payoffs, idx, tol):
+                return [tuple(strat_lists[i][k] for i, k in enumerate(idx))]
+        return []
+
+    # The hottest shapes (2x2 and friends) skip the array machinery and run
+    # a checker unrolled for that exact grid, compiled once per shape.
+    size = 1
+    for k in shape:
+        size *= k
+    if size <= _CODEGEN_MAX_CELLS:
+        check = _compile_ne_checker(shape)
+        return [tuple(strat_lists[i][k] for i, k in enumerate(idx))
+                for idx in check(player_payoffs, tol)]
+
+    # A profile is a NE iff every player's payoff is within tol of the max
+    # over their own strategy axis, holding everyone else fixed.  The
+    # tolerance keeps FP noise in user-entered payoffs from breaking ties.
+    is_eq = np.ones(shape, dtype=bool)
+    for i, pa in enumerate(player_payoffs):
+        is_eq &= pa >= pa.max(axis=i, keepdims=True) - tol
+
+    return [tuple(strat_lists[i][k] for i, k in enumerate(idx))
+            for idx in np.argwhere(is_eq)]
+
+
+def one_nash(players, strategies, payoffs, tol=1e-12):
+    """Return the first pure Nash equilibrium found, or None."""
+    equilibria = pure_nash_equilibria(players, strategies, payoffs, tol=tol,
+                                      first_only=True)
+    return equilibria[0] if equilibria else None
 
 
 # ---------- Simulation ----------
 
-def simulate(players, strategies, payoffs, repetitions):
-    history = []
-    total_scores = {p: 0 for p in players}
+def _sample_rounds(compiled, repetitions):
+    # Sample every round's strategy indices up front and gather the payoffs
+    # in one shot, instead of hashing an n-string tuple per round.  The
+    # per-player strategy counts broadcast into a single rng call.
+    player_payoffs, strat_lists, idx_maps = compiled
+    shape = player_payoffs[0].shape
+    n = len(player_payoffs)
+
+    rng = np.random.default_rng()
+    idx = rng.integers(0, np.array(shape), size=(repetitions, n))
+    grid = tuple(idx.T)
+    payoff_gather = np.stack([pp[grid] for pp in player_payoffs], axis=1)
+    return idx, payoff_gather
+
+
+def simulate_totals(players, strategies, payoffs, repetitions, compiled=None):
+    """Simulate repeated random play, returning only the total scores.
+
+    Skips materializing the O(repetitions) history entirely.
+    """
+    if compiled is None:
+        compiled = compile_game(players, strategies, payoffs)
+    _, payoff_gather = _sample_rounds(compiled, repetitions)
 
+    # One column-sum reduction replaces the interpreted += per round.
+    totals_vec = payoff_gather.sum(axis=0, dtype=np.float64)
+    return dict(zip(players, totals_vec.tolist()))
+
+
+def simulate_history(players, strategies, payoffs, repetitions, compiled=None):
+    """Simulate repeated random play, returning (history, total_scores)."""
+    if compiled is None:
+        compiled = compile_game(players, strategies, payoffs)
+    _, strat_lists, _ = compiled
+    n = len(strat_lists)
+    idx, payoff_gather = _sample_rounds(compiled, repetitions)
+
+    history = []
     for r in range(repetitions):
-        profile = tuple(random.choice(strategies[p]) for p in players)
-        payoff = payoffs[profile]
-        history.append((profile, payoff))
-        for i, p in enumerate(players):
-            total_scores[p] += payoff[i]
+        profile = tuple(strat_lists[i][idx[r, i]] for i in range(n))
+        history.append((profile, tuple(payoff_gather[r].tolist())))
+
+    totals_vec = payoff_gather.sum(axis=0, dtype=np.float64)
+    return history, dict(zip(players, totals_vec.tolist()))
 
-    return history, total_scores
+
+simulate = simulate_history  # kept for existing callers
 
 
 # ---------- Menu System ----------
@@ -147,18 +287,31 @@ def main():
     players, strategies, payoffs = choose_game()
     repetitions = int(input("\nEnter number of repetitions for simulation: "))
 
+    compiled = compile_game(players, strategies, payoffs)
+
     print("\n=== Pure Nash Equilibria ===")
-    equilibria = pure_nash_equilibria(players, strategies, payoffs)
+    equilibria = pure_nash_equilibria(players, strategies, payoffs,
+                                      compiled=compiled)
     if equilibria:
         for eq in equilibria:
             print("NE:", eq, "->", payoffs[eq])
     else:
         print("No pure strategy NE found.")
 
+    show_rounds = input("Show round-by-round history? (y/n): ").lower() == "y"
+
     print("\n=== Simulation of repeated play ===")
-    history, totals = simulate(players, strategies, payoffs, repetitions)
-    for round_num, (prof, payoff) in enumerate(history, start=1):
-        print(f"Round {round_num}: {prof} -> {payoff}")
+    if show_rounds:
+        history, totals = simulate_history(players, strategies, payoffs,
+                                           repetitions, compiled=compiled)
+        # One buffered write instead of a flush-happy print per round.
+        sys.stdout.write(
+            "\n".join(f"Round {round_num}: {prof} -> {payoff}"
+                      for round_num, (prof, payoff) in enumerate(history, start=1))
+            + "\n")
+    else:
+        totals = simulate_totals(players, strategies, payoffs, repetitions,
+                                 compiled=compiled)
 
     print("\nTotal scores after", repetitions, "rounds:")
     for p in players:
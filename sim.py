@@ -10,70 +10,245 @@ Default: Iterated Prisoner's Dilemma.
 """
 
 import itertools
-import random
+
+import numpy as np
+from numba import njit, prange
 
 # ------------------ Payoff Matrix ------------------
-# (Player1 move, Player2 move) -> (P1 payoff, P2 payoff)
-PD_PAYOFFS = {
-    ("C", "C"): (3, 3),
-    ("C", "D"): (0, 5),
-    ("D", "C"): (5, 0),
-    ("D", "D"): (1, 1),
-}
+# Moves are encoded as small integers: C = 0, D = 1.
+# PD_PAYOFFS_ARR[move1, move2] -> (P1 payoff, P2 payoff)
+C, D = 0, 1
+
+PD_PAYOFFS_ARR = np.array(
+    [[(3, 3), (0, 5)],
+     [(5, 0), (1, 1)]],
+    dtype=np.int32,
+)
 
 # ------------------ Strategy Functions ------------------
-# Each strategy takes (my_history, opp_history) and returns "C" or "D".
+# Each strategy takes (my_history, opp_history) and returns C or D.
+# Histories are uint8 arrays of the moves played so far.
 
 def always_cooperate(my_hist, opp_hist):
-    return "C"
+    return C
 
 def always_defect(my_hist, opp_hist):
-    return "D"
+    return D
 
 def tit_for_tat(my_hist, opp_hist):
-    if not opp_hist:
-        return "C"  # cooperate first
+    if len(opp_hist) == 0:
+        return C  # cooperate first
     return opp_hist[-1]  # copy opponent’s last move
 
-def random_strategy(my_hist, opp_hist):
-    return random.choice(["C", "D"])
+def make_random_strategy(rng=None, block=4096):
+    """Build a random C/D strategy that draws from pre-rolled blocks of bits.
+
+    One rng call fills a whole block, amortizing the per-call Python and
+    RNG-state overhead across thousands of rounds.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    buf = np.empty(0, dtype=np.uint8)
+    pos = 0
+
+    def random_strategy(my_hist, opp_hist):
+        nonlocal buf, pos
+        if pos >= buf.size:
+            buf = rng.integers(0, 2, size=block, dtype=np.uint8)
+            pos = 0
+        move = int(buf[pos])
+        pos += 1
+        return move
+
+    random_strategy.nb_strat_id = RANDOM
+    random_strategy.rng = rng
+    return random_strategy
 
 # You can add new strategies here!
 
 
+# ------------------ Compiled Strategies ------------------
+# The built-in strategies need at most the opponent's last move (or, for
+# the random strategy, a pre-rolled buffer of moves), so the whole round
+# loop can run under Numba: strategies become integer ids switched on
+# inside a JIT-compiled loop, with no Python call per round.
+
+ALWAYS_C, ALWAYS_D, TIT_FOR_TAT, RANDOM = 0, 1, 2, 3
+
+# Maps strategy functions to their compiled ids; random strategies carry
+# theirs as an nb_strat_id attribute instead (see make_random_strategy).
+# Strategies with no id fall back to the interpreted loop in play_rounds.
+NB_STRAT_IDS = {
+    always_cooperate: ALWAYS_C,
+    always_defect: ALWAYS_D,
+    tit_for_tat: TIT_FOR_TAT,
+}
+
+_EMPTY_MOVES = np.empty(0, dtype=np.uint8)
+
+def _nb_strat_id(func):
+    sid = NB_STRAT_IDS.get(func)
+    if sid is None:
+        sid = getattr(func, "nb_strat_id", None)
+    return sid
+
+@njit(cache=True)
+def _next_move_nb(strat_id, last_opp, r, moves):
+    if strat_id == ALWAYS_C:
+        return C
+    if strat_id == ALWAYS_D:
+        return D
+    if strat_id == RANDOM:
+        return moves[r]
+    # TIT_FOR_TAT
+    if r == 0:
+        return C
+    return last_opp
+
+@njit(cache=True)
+def play_rounds_nb(strat1_id, strat2_id, rounds, payoff_matrix,
+                   moves1, moves2):
+    score1, score2 = 0, 0
+    last1, last2 = C, C
+
+    for r in range(rounds):
+        move1 = _next_move_nb(strat1_id, last2, r, moves1)
+        move2 = _next_move_nb(strat2_id, last1, r, moves2)
+        score1 += payoff_matrix[move1, move2, 0]
+        score2 += payoff_matrix[move1, move2, 1]
+        last1, last2 = move1, move2
+
+    return score1, score2
+
+# The shared default instance (created here so it can pick up its
+# compiled id); tournaments reseed their own instances per matchup.
+random_strategy = make_random_strategy()
+
+
 # ------------------ Tournament Simulator ------------------
 
-def play_rounds(strat1, strat2, rounds=10, payoff_matrix=PD_PAYOFFS):
-    """Play repeated game between two strategies for given rounds."""
-    history1, history2 = [], []
+def play_rounds(strat1, strat2, rounds=10, payoff_matrix=PD_PAYOFFS_ARR):
+    """Play repeated game between two strategies for given rounds.
+
+    The built-in strategies only ever look at the opponent's last move, so
+    by default the histories passed to strategies are one-move rolling
+    windows (O(1) memory). A custom strategy that needs the full history
+    must set `needs_history = True` on the function.
+    """
+    id1 = _nb_strat_id(strat1)
+    id2 = _nb_strat_id(strat2)
+    if id1 is not None and id2 is not None:
+        # Random strategies draw from a buffer pre-rolled off their own rng,
+        # so the compiled loop makes zero RNG calls.
+        moves1 = (strat1.rng.integers(0, 2, size=rounds, dtype=np.uint8)
+                  if id1 == RANDOM else _EMPTY_MOVES)
+        moves2 = (strat2.rng.integers(0, 2, size=rounds, dtype=np.uint8)
+                  if id2 == RANDOM else _EMPTY_MOVES)
+        s1, s2 = play_rounds_nb(id1, id2, rounds, payoff_matrix,
+                                moves1, moves2)
+        return int(s1), int(s2)
+
+    keep_full = (getattr(strat1, "needs_history", False)
+                 or getattr(strat2, "needs_history", False))
+    if keep_full:
+        history1 = np.empty(rounds, dtype=np.uint8)
+        history2 = np.empty(rounds, dtype=np.uint8)
+    else:
+        history1 = np.zeros(1, dtype=np.uint8)
+        history2 = np.zeros(1, dtype=np.uint8)
     score1, score2 = 0, 0
 
-    for _ in range(rounds):
-        move1 = strat1(history1, history2)
-        move2 = strat2(history2, history1)
-        payoff = payoff_matrix[(move1, move2)]
-        score1 += payoff[0]
-        score2 += payoff[1]
-        history1.append(move1)
-        history2.append(move2)
+    for r in range(rounds):
+        if keep_full:
+            hist1, hist2 = history1[:r], history2[:r]
+        else:
+            # Empty on the first round, then just the last move.
+            hist1 = history1 if r else history1[:0]
+            hist2 = history2 if r else history2[:0]
+        move1 = strat1(hist1, hist2)
+        move2 = strat2(hist2, hist1)
+        score1 += int(payoff_matrix[move1, move2, 0])
+        score2 += int(payoff_matrix[move1, move2, 1])
+        if keep_full:
+            history1[r] = move1
+            history2[r] = move2
+        else:
+            history1[0] = move1
+            history2[0] = move2
 
     return score1, score2
 
 
-def tournament(strategies, rounds_per_game=10):
-    """Run round-robin tournament among all strategies."""
-    totals = {name: 0 for name in strategies}
+@njit(cache=True, parallel=True)
+def _tournament_nb(pairs, strat_ids, rounds, payoff_matrix, moves):
+    scores = np.zeros((len(pairs), 2), dtype=np.int64)
+    for k in prange(len(pairs)):
+        i, j = pairs[k, 0], pairs[k, 1]
+        s1, s2 = play_rounds_nb(strat_ids[i], strat_ids[j], rounds,
+                                payoff_matrix, moves[k, 0], moves[k, 1])
+        scores[k, 0] = s1
+        scores[k, 1] = s2
+    return scores
+
+
+def tournament(strategies, rounds_per_game=10, seed=None):
+    """Run round-robin tournament among all strategies.
+
+    Each matchup gets its own RNG stream spawned from `seed` via
+    SeedSequence, so stochastic strategies are reproducible and safe to
+    run in parallel without sharing generator state.
+    """
+    # Index-based parallel lists instead of dict items: matchups become
+    # integer pairs and scores accumulate into a flat array, with the name
+    # strings only touched once when building the result dict.
+    names = list(strategies)
+    funcs = list(strategies.values())
+    S = len(names)
+    totals = np.zeros(S, dtype=np.int64)
+
+    pairs = list(itertools.combinations_with_replacement(range(S), 2))
+    children = np.random.SeedSequence(seed).spawn(len(pairs))
 
-    for (name1, strat1), (name2, strat2) in itertools.combinations(strategies.items(), 2):
-        s1, s2 = play_rounds(strat1, strat2, rounds=rounds_per_game)
-        totals[name1] += s1
-        totals[name2] += s2
-        # also let them play against themselves
-    for name, strat in strategies.items():
-        s1, s2 = play_rounds(strat, strat, rounds=rounds_per_game)
-        totals[name] += s1  # self-play counts too
+    # One pass over the upper triangle including the diagonal: self-play is
+    # just the i == j matchup (only the row player's score counts, as
+    # before), so the payoff matrix is walked once instead of twice.
+    # Matchups are independent, so when every strategy is JIT-registered
+    # the round-robin runs as one parallel prange over the pair list.
+    strat_ids = [_nb_strat_id(func) for func in funcs]
+    if all(sid is not None for sid in strat_ids):
+        strat_ids = np.array(strat_ids, dtype=np.int64)
+        pairs_arr = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+        # Pre-roll every matchup's random moves from its own child stream,
+        # outside the parallel region: zero RNG calls in the hot loop.
+        moves = np.zeros((len(pairs), 2, rounds_per_game), dtype=np.uint8)
+        for k, (i, j) in enumerate(pairs):
+            if strat_ids[i] == RANDOM or strat_ids[j] == RANDOM:
+                rng = np.random.default_rng(children[k])
+                for side, player in enumerate((i, j)):
+                    if strat_ids[player] == RANDOM:
+                        moves[k, side] = rng.integers(0, 2, size=rounds_per_game,
+                                                      dtype=np.uint8)
+        scores = _tournament_nb(pairs_arr, strat_ids, rounds_per_game,
+                                PD_PAYOFFS_ARR, moves)
+        off_diag = pairs_arr[:, 0] != pairs_arr[:, 1]
+        np.add.at(totals, pairs_arr[:, 0], scores[:, 0])
+        np.add.at(totals, pairs_arr[off_diag, 1], scores[off_diag, 1])
+    else:
+        for k, (i, j) in enumerate(pairs):
+            rng = np.random.default_rng(children[k])
+            strat1, strat2 = funcs[i], funcs[j]
+            # Give random strategies a fresh instance on this matchup's
+            # stream so results depend only on seed, not call order.
+            if _nb_strat_id(strat1) == RANDOM:
+                strat1 = make_random_strategy(rng)
+            if _nb_strat_id(strat2) == RANDOM:
+                strat2 = make_random_strategy(rng)
+            s1, s2 = play_rounds(strat1, strat2, rounds=rounds_per_game)
+            totals[i] += s1
+            if j != i:
+                totals[j] += s2
 
-    return totals
+    return {name: int(total) for name, total in zip(names, totals)}
 
 
 # ------------------ Main ------------------